@@ -0,0 +1,186 @@
+import streamlit as st
+import pandas as pd
+import pyarrow as pa
+import numpy as np
+from wordcloud import WordCloud, STOPWORDS
+import re
+import os
+import tempfile
+
+# Data loading and cached aggregates shared by the dashboard entrypoints
+
+DATA_CSV = 'jobstreet_all_cleaned.csv'
+# Bump when load_data's output changes so stale Parquet snapshots are rebuilt
+SNAPSHOT_VERSION = 4
+DATA_PARQUET = f'jobstreet_all_cleaned.v{SNAPSHOT_VERSION}.parquet'
+
+SALARY_LIMIT = 10000000
+SALARY_STEP = 100000
+
+# Boilerplate phrases and non-letter characters stripped from job descriptions in one regex pass
+COMMON_PHRASES = ["qualification", "job description", "responsibilities", "join us", "we are looking for", "job details"]
+# Kept as a plain string: Arrow's str.replace kernel compiles its own regex and rejects re.Pattern objects
+DESCRIPTION_NOISE_PATTERN = '|'.join(map(re.escape, COMMON_PHRASES)) + r'|[^a-z\s]'
+
+WORDCLOUD_MAX_WORDS = 200
+
+CATEGORY_COLUMNS = ('Category', 'Company', 'Location')
+
+def normalize_dtypes(df):
+    # Both load paths end here so the CSV parse and the Parquet snapshot give identical frames
+    arrow_string = pd.ArrowDtype(pa.string())
+    for column in df.columns:
+        if isinstance(df[column].dtype, pd.StringDtype):
+            df[column] = df[column].astype(arrow_string)
+    # Low-cardinality text columns are stored as categoricals for faster filtering and counting
+    for column in CATEGORY_COLUMNS:
+        if isinstance(df[column].dtype, pd.CategoricalDtype):
+            # Snapshot columns are already categorical; only the small categories index needs Arrow strings
+            categories = df[column].cat.categories.astype(arrow_string)
+            df[column] = df[column].cat.rename_categories(categories)
+        else:
+            df[column] = df[column].astype(arrow_string).astype('category')
+    # Parquet has no second-resolution timestamps, so the unit is restored after reading
+    df['Date Posted Clean'] = df['Date Posted Clean'].astype('datetime64[s]')
+    return df
+
+# Load data with caching
+@st.cache_data
+def load_data():
+    # Reuse the cleaned Parquet snapshot unless the CSV has changed since it was written
+    if os.path.exists(DATA_PARQUET) and os.path.getmtime(DATA_PARQUET) >= os.path.getmtime(DATA_CSV):
+        try:
+            df = pd.read_parquet(DATA_PARQUET, engine='pyarrow')
+        except (ValueError, OSError):
+            pass  # Unreadable snapshot: rebuild it from the CSV below
+        else:
+            return normalize_dtypes(df)
+
+    # Arrow-backed strings; the pyarrow CSV engine can't parse the multi-line descriptions, so keep the C parser
+    df = pd.read_csv(DATA_CSV, dtype_backend='pyarrow')
+    df['Date Posted Clean'] = pd.to_datetime(df['Date Posted Clean'], errors='coerce')
+
+    # Handling Salary: split salary into Min and Max
+    # One pass strips the currency tokens; the extract accepts either dash so no second replace is needed
+    salary = df['Salary'].str.replace(r'Rp|IDR|per month', '', regex=True)
+    salary_parts = salary.str.extract(r'^\s*(?P<min>[\d,]+)\s*[-–]\s*(?P<max>[\d,]+)\s*$')
+    for column, part in (('Salary Min', 'min'), ('Salary Max', 'max')):
+        amount = pd.to_numeric(salary_parts[part].str.replace(',', '', regex=False), errors='coerce')
+        # Monthly IDR salaries fit in int32; anything larger is a parse error and falls back to 0 like the rest
+        df[column] = amount.where(amount <= np.iinfo('int32').max).fillna(0).astype('int32')
+
+    # Clean descriptions once here so the word cloud only has to join them
+    df['Job Description Clean'] = df['Job Description'].fillna('').str.lower().str.replace(DESCRIPTION_NOISE_PATTERN, ' ', regex=True)
+
+    normalize_dtypes(df)
+
+    # Keep rows in date order so groupbys can skip sorting their keys
+    df.sort_values('Date Posted Clean', inplace=True, kind='mergesort')
+    df.reset_index(drop=True, inplace=True)
+
+    # Write to a temp file and swap it in, so an interrupted write never leaves a truncated snapshot behind
+    snapshot_dir = os.path.dirname(os.path.abspath(DATA_PARQUET))
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=snapshot_dir, suffix='.parquet.tmp')
+    except OSError:
+        return df  # Read-only deployments just parse the CSV on every cold start
+    os.close(fd)
+    try:
+        df.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+        os.replace(tmp_path, DATA_PARQUET)
+    except Exception:
+        pass  # The snapshot is only a cache; a failed write must not break loading
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return df
+
+# Filtered views and aggregates are cached per (categories, salary range) so reruns reuse them
+@st.cache_data
+def get_filtered(categories, min_salary, max_salary):
+    df = load_data()
+    # One fused mask over the raw arrays; unknown categories (-1) must not match missing values
+    category_codes = df['Category'].cat.categories.get_indexer(list(categories))
+    mask = np.isin(df['Category'].cat.codes.to_numpy(), category_codes[category_codes >= 0])
+    mask &= df['Salary Min'].to_numpy() >= min_salary
+    mask &= df['Salary Max'].to_numpy() <= max_salary
+    return df.iloc[mask]
+
+FILTER_GROUP = ['Category', 'Salary Min Step', 'Salary Max Step']
+
+def with_salary_steps(df):
+    # Bounds are whole slider steps, so rounding Salary Min down and Salary Max up keeps the filter exact
+    return df.assign(**{
+        'Salary Min Step': df['Salary Min'] // SALARY_STEP,
+        'Salary Max Step': -(-df['Salary Max'] // SALARY_STEP),
+    })
+
+def in_filter_group(category, min_step, max_step, categories, min_salary, max_salary):
+    return category.isin(categories) & (min_step >= min_salary // SALARY_STEP) & (max_step <= max_salary // SALARY_STEP)
+
+@st.cache_data
+def daily_counts():
+    steps = with_salary_steps(load_data())
+    return steps.groupby(['Date Posted Clean'] + FILTER_GROUP, sort=False, observed=True).size().reset_index(name='Job Count')
+
+def daily_counts_in_range(categories, min_salary, max_salary):
+    counts = daily_counts()
+    return counts[in_filter_group(*(counts[key] for key in FILTER_GROUP), categories, min_salary, max_salary)]
+
+@st.cache_data
+def jobs_per_day(categories, min_salary, max_salary):
+    counts = daily_counts_in_range(categories, min_salary, max_salary)
+    # daily_counts rows are already grouped by date, so each day is one run: sum the runs instead of regrouping
+    dates = counts['Date Posted Clean'].to_numpy()
+    run_starts = np.flatnonzero(np.r_[True, dates[1:] != dates[:-1]]) if len(dates) else np.empty(0, dtype=np.intp)
+    return pd.DataFrame({
+        'Date Posted Clean': dates[run_starts],
+        'Job Count': np.add.reduceat(counts['Job Count'].to_numpy(), run_starts),
+    })
+
+@st.cache_data
+def jobs_per_day_by_category(categories, min_salary, max_salary):
+    counts = daily_counts_in_range(categories, min_salary, max_salary)
+    return counts.groupby(['Date Posted Clean', 'Category'], sort=False, observed=True)['Job Count'].sum().unstack('Category', fill_value=0)
+
+@st.cache_data
+def filter_group_counts(column):
+    steps = with_salary_steps(load_data())
+    return steps.groupby([column] + FILTER_GROUP, observed=True).size().unstack(FILTER_GROUP, fill_value=0)
+
+@st.cache_data
+def top_counts(column, categories, min_salary, max_salary, n=10):
+    table = filter_group_counts(column)
+    groups = table.columns
+    mask = in_filter_group(*(groups.get_level_values(key) for key in FILTER_GROUP), categories, min_salary, max_salary)
+    totals = table.loc[:, mask].sum(axis=1).rename('count')
+    totals = totals[totals > 0]
+    if len(totals) > n:
+        totals = totals.iloc[np.argpartition(-totals.to_numpy(), n)[:n]]
+    return totals.sort_values(ascending=False, kind='stable')
+
+# Histogram bins come from the full data so the salary charts keep the same bars as the filter changes
+@st.cache_data
+def salary_bin_edges(column, bins=20):
+    salaries = load_data()[column].to_numpy()
+    # Only salaries the sidebar can ever let through (at most SALARY_LIMIT) shape the bins
+    return np.histogram_bin_edges(salaries[(salaries > 0) & (salaries <= SALARY_LIMIT)], bins=bins)
+
+@st.cache_data
+def salary_histogram(column, categories, min_salary, max_salary):
+    salaries = get_filtered(categories, min_salary, max_salary)[column].to_numpy()
+    return np.histogram(salaries[salaries > 0], bins=salary_bin_edges(column))
+
+# Count words straight from the cleaned column instead of joining one huge string for WordCloud to re-tokenize
+@st.cache_data
+def word_frequencies(categories, min_salary, max_salary):
+    filtered_df = get_filtered(categories, min_salary, max_salary)
+    words = filtered_df['Job Description Clean'].str.split().explode().dropna()
+    words = words[(words.str.len() > 2) & ~words.isin(STOPWORDS)]
+    return words.value_counts().head(WORDCLOUD_MAX_WORDS).to_dict()
+
+@st.cache_data
+def build_wordcloud(frequencies):
+    return WordCloud(width=800, height=400, background_color='white', colormap='viridis',
+                     max_words=WORDCLOUD_MAX_WORDS).generate_from_frequencies(frequencies).to_array()
@@ -1,54 +1,36 @@
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-from wordcloud import WordCloud
-import seaborn as sns
-import re
+import numpy as np
+import matplotlib
+from matplotlib.figure import Figure
 import matplotlib.ticker as ticker
 
+from dashboard_core import (
+    SALARY_LIMIT, SALARY_STEP, load_data, jobs_per_day, jobs_per_day_by_category,
+    top_counts, salary_histogram, word_frequencies, build_wordcloud,
+)
+
 # Set up the Streamlit page
 st.set_page_config(layout="wide", page_title="Jobstreet Dashboard")
 
-st.title("📊 Jobstreet Data Dashboard")
+# Figures are built directly on Figure objects (no pyplot registry), so nothing leaks across reruns
+matplotlib.rcParams['path.simplify_threshold'] = 1.0
 
-# Load data with caching
-@st.cache_data
-def load_data():
-    df = pd.read_csv('jobstreet_all_cleaned.csv')
-    df['Date Posted Clean'] = pd.to_datetime(df['Date Posted Clean'], errors='coerce')
-
-    # Handling Salary: split salary into Min and Max
-    def parse_salary(salary_str):
-        if isinstance(salary_str, str):
-            salary_str = salary_str.replace('Rp', '').replace('IDR', '').replace('per month', '').replace('–', '-')
-            salary_parts = salary_str.split('-')
-            if len(salary_parts) == 2:
-                try:
-                    salary_min = int(salary_parts[0].replace(',', '').strip())
-                    salary_max = int(salary_parts[1].replace(',', '').strip())
-                    return salary_min, salary_max
-                except ValueError:
-                    return 0, 0
-            return 0, 0
-        return 0, 0
-
-    df[['Salary Min', 'Salary Max']] = df['Salary'].apply(lambda x: pd.Series(parse_salary(x)))
-    df['Salary Min'] = pd.to_numeric(df['Salary Min'], errors='coerce')
-    df['Salary Max'] = pd.to_numeric(df['Salary Max'], errors='coerce')
-    
-    return df
+st.title("📊 Jobstreet Data Dashboard")
 
 df = load_data()
 
 # Sidebar filter
 st.sidebar.header("🔍 Filter Data")
 selected_category = st.sidebar.multiselect("Select Category:", df['Category'].unique(), default=list(df['Category'].unique()))
-min_salary = st.sidebar.slider('Minimum Salary (IDR)', 0, 10000000, 0, 100000)
-max_salary = st.sidebar.slider('Maximum Salary (IDR)', 0, 10000000, 10000000, 100000)
+min_salary = st.sidebar.slider('Minimum Salary (IDR)', 0, SALARY_LIMIT, 0, SALARY_STEP)
+max_salary = st.sidebar.slider('Maximum Salary (IDR)', 0, SALARY_LIMIT, SALARY_LIMIT, SALARY_STEP)
+
+# Snap bounds to the slider step so equivalent positions share one cache entry
+min_salary = (min_salary // SALARY_STEP) * SALARY_STEP
+max_salary = (max_salary // SALARY_STEP) * SALARY_STEP
 
-# Filter dataframe based on salary range
-filtered_df = df[df['Category'].isin(selected_category)]
-filtered_df = filtered_df[(filtered_df['Salary Min'] >= min_salary) & (filtered_df['Salary Max'] <= max_salary)]
+# Cache key shared by every filtered view below
+filter_key = (tuple(sorted(selected_category)), min_salary, max_salary)
 
 # Tabs for different analysis
 tab1, tab2, tab3, tab4 = st.tabs(["📅 Time Trends", "🏢 Company & Location", "💰 Salary", "☁️ Keywords"])
@@ -56,27 +38,28 @@ tab1, tab2, tab3, tab4 = st.tabs(["📅 Time Trends", "🏢 Company & Location",
 # Tab 1 - Trend Jobs over Time
 with tab1:
     st.subheader("Job Count per Day")
-    job_per_day = filtered_df.groupby('Date Posted Clean').size().reset_index(name='Job Count')
-    fig, ax = plt.subplots(figsize=(12, 5))
+    job_per_day = jobs_per_day(*filter_key)
+    fig = Figure(figsize=(12, 5))
+    ax = fig.subplots()
     ax.plot(job_per_day['Date Posted Clean'], job_per_day['Job Count'], marker='o')
     ax.set_title("Job Count per Day")
     ax.set_xlabel("Date")
     ax.set_ylabel("Job Count")
     ax.grid(True)
-    st.pyplot(fig)
+    st.pyplot(fig, clear_figure=True)
 
     st.subheader("Job Count per Day by Category")
-    job_per_day_category = filtered_df.groupby(['Date Posted Clean', 'Category']).size().reset_index(name='Job Count')
-    fig, ax = plt.subplots(figsize=(12, 5))
-    for category in selected_category:
-        category_data = job_per_day_category[job_per_day_category['Category'] == category]
-        ax.plot(category_data['Date Posted Clean'], category_data['Job Count'], marker='o', label=category)
+    job_per_day_category = jobs_per_day_by_category(*filter_key)
+    job_per_day_category = job_per_day_category.reindex(columns=selected_category, fill_value=0)
+    fig = Figure(figsize=(12, 5))
+    ax = fig.subplots()
+    ax.plot(job_per_day_category.index, job_per_day_category.values, marker='o')
     ax.set_title("Job Count per Day by Category")
     ax.set_xlabel("Date")
     ax.set_ylabel("Job Count")
-    ax.legend(title='Category')
+    ax.legend(job_per_day_category.columns, title='Category')
     ax.grid(True)
-    st.pyplot(fig)
+    st.pyplot(fig, clear_figure=True)
 
 # Tab 2 - Company & Location
 with tab2:
@@ -84,20 +67,21 @@ with tab2:
 
     with col1:
         st.subheader("Top 10 Companies")
-        top_companies = filtered_df['Company'].value_counts().head(10)
+        top_companies = top_counts('Company', *filter_key)
         st.bar_chart(top_companies)
 
     with col2:
         st.subheader("Top Locations")
-        top_locations = filtered_df['Location'].value_counts().head(10)
+        top_locations = top_counts('Location', *filter_key)
         st.bar_chart(top_locations)
 
 # Tab 3 - Salary
 with tab3:
     st.subheader("Minimum Salary Distribution")
-    salary = filtered_df[filtered_df['Salary Min'] > 0]
-    fig, ax = plt.subplots(figsize=(10, 4))
-    ax.hist(salary['Salary Min'], bins=20, color='orange', edgecolor='black')
+    counts, edges = salary_histogram('Salary Min', *filter_key)
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots()
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color='orange', edgecolor='black')
     ax.set_title('Minimum Salary Distribution')
     ax.set_xlabel('Minimum Salary')
     ax.set_ylabel('Job Count')
@@ -105,13 +89,14 @@ with tab3:
     # Format x-axis to display as currency
     ax.xaxis.set_major_formatter(ticker.FuncFormatter(lambda x, _: f'Rp {x:,.0f}'))
 
-    st.pyplot(fig)
+    st.pyplot(fig, clear_figure=True)
 
     st.subheader("Maximum Salary Distribution")
-    # Filter out rows where Salary Max is 0 or NaN to ensure valid data
-    valid_data = filtered_df[filtered_df['Salary Max'] > 0]
-    fig, ax = plt.subplots(figsize=(10, 4))
-    ax.hist(valid_data['Salary Max'], bins=20, color='blue', edgecolor='black')
+    # Salary Max of 0 marks an unparsed salary, so the histogram skips it
+    counts, edges = salary_histogram('Salary Max', *filter_key)
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots()
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', color='blue', edgecolor='black')
     ax.set_title('Maximum Salary Distribution')
     ax.set_xlabel('Maximum Salary')
     ax.set_ylabel('Job Count')
@@ -119,25 +104,18 @@ with tab3:
     # Format x-axis to display as currency
     ax.xaxis.set_major_formatter(ticker.FuncFormatter(lambda x, _: f'Rp {x:,.0f}'))
 
-    st.pyplot(fig)
+    st.pyplot(fig, clear_figure=True)
 
 
 # Tab 4 - Job Description Keywords
 with tab4:
     st.subheader("Word Cloud of Job Descriptions")
-    common_phrases = ["qualification", "job description", "responsibilities", "join us", "we are looking for", "job details"]
-
-    def clean_description(text):
-        text = text.lower()
-        text = re.sub(r'[^a-zA-Z\\s]', ' ', text)
-        for phrase in common_phrases:
-            text = text.replace(phrase, '')
-        return text
-
-    text = ' '.join(filtered_df['Job Description'].dropna().apply(clean_description).tolist())
-    wordcloud = WordCloud(width=800, height=400, background_color='white', colormap='viridis').generate(text)
-    
-    fig, ax = plt.subplots(figsize=(15, 7))
-    ax.imshow(wordcloud, interpolation='bilinear')
-    ax.axis('off')
-    st.pyplot(fig)
+    frequencies = word_frequencies(*filter_key)
+    if frequencies:
+        fig = Figure(figsize=(15, 7))
+        ax = fig.subplots()
+        ax.imshow(build_wordcloud(frequencies), interpolation='bilinear')
+        ax.axis('off')
+        st.pyplot(fig, clear_figure=True)
+    else:
+        st.info("No job descriptions match the current filter.")